@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Convert the maturity score source datasets from CSV to Parquet.
+
+The three inputs read by extract_regional_inputs.py rarely change, so parsing
+them as text on every run is wasted work. This script writes a Parquet copy next
+to each CSV (snappy-compressed, dictionary-encoded strings). The extractor uses a
+copy only while it is at least as new as its CSV; after a source is rebuilt
+(e.g. by generate_complexity_dataset.py or sdlc_classifier.py) it reads the CSV
+again until this script is re-run.
+
+Requires pyarrow.
+"""
+
+import pandas as pd
+import os
+
+from extract_regional_inputs import COLLAB_FILE, LENGTH_FILE, REQUEST_FILE, parquet_path
+
+def convert_sources():
+    """Write a Parquet copy of each source CSV."""
+    for csv_file in [COLLAB_FILE, LENGTH_FILE, REQUEST_FILE]:
+        df = pd.read_csv(csv_file)
+        output_file = parquet_path(csv_file)
+        df.to_parquet(output_file, engine='pyarrow', compression='snappy', index=False)
+        print(f"  {csv_file} -> {output_file} ({len(df):,} rows)")
+
+if __name__ == "__main__":
+    # Change to script directory so relative source paths resolve
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(script_dir)
+
+    print("Converting source datasets to Parquet...")
+    convert_sources()
+    print(f"\n✅ Conversion complete!")
@@ -12,48 +12,107 @@ Output: regional_inputs.csv with standardized regional metrics
 
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Canonical region order for all outputs
+REGIONS = ('North America', 'Latin America', 'Europe', 'Middle East & Africa', 'APAC')
+
+# Source datasets from the three analysis areas
+COLLAB_FILE = "../Collaboration Analysis/regional_collaboration_analysis.csv"
+LENGTH_FILE = "../Onet Analysis/onetregionalraw_with_complexity.csv"
+REQUEST_FILE = "../Software Request Analysis/softwareregionalrequests_with_sdlc.csv"
+
+# Columns each extractor reads from its source
+COLLAB_COLUMNS = ('region', 'variable', 'cluster_name', 'value')
+LENGTH_COLUMNS = ('region', 'domain', 'variable', 'value')
+REQUEST_COLUMNS = ('region', 'level', 'value')
+
+# Low-cardinality key columns are stored as categoricals so filters compare codes
+SOURCE_DTYPES = {
+    'region': 'category',
+    'variable': 'category',
+    'cluster_name': 'category',
+    'domain': 'category',
+    'level': 'int8'
+}
+
+def parquet_path(path):
+    """Return the Parquet sibling of a source CSV."""
+    return os.path.splitext(path)[0] + ".parquet"
+
+@lru_cache(maxsize=None)
+def load_source(path, usecols):
+    """Load a source dataset once per process; callers must treat the frame as read-only.
+
+    Reads the Parquet copy written by convert_sources_to_parquet.py when it is at
+    least as new as the CSV, otherwise falls back to parsing the CSV so a rebuilt
+    source is never shadowed by a stale copy.
+    """
+    dtypes = {col: SOURCE_DTYPES[col] for col in usecols if col in SOURCE_DTYPES}
+    pq = parquet_path(path)
+    if os.path.exists(pq) and os.path.getmtime(pq) >= os.path.getmtime(path):
+        return pd.read_parquet(pq, columns=list(usecols)).astype(dtypes)
+    return pd.read_csv(path, usecols=list(usecols), dtype=dtypes)
+
+def prefetch_sources():
+    """Read all three source datasets concurrently so the extractors hit the load cache."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(load_source,
+                          [COLLAB_FILE, LENGTH_FILE, REQUEST_FILE],
+                          [COLLAB_COLUMNS, LENGTH_COLUMNS, REQUEST_COLUMNS]))
 
 def extract_collaboration_metrics():
-    """Extract collaboration pattern percentages by region."""
+    """Extract collaboration pattern percentages, one row per region."""
     print("Extracting collaboration metrics...")
 
     # Load collaboration data
-    collab_file = "../Collaboration Analysis/regional_collaboration_analysis.csv"
-    df_collab = pd.read_csv(collab_file)
+    df_collab = load_source(COLLAB_FILE, COLLAB_COLUMNS)
 
     # Filter for percentage data and relevant patterns
-    collab_pct = df_collab[df_collab['variable'] == 'collaboration_pct'].copy()
+    collab_pct = df_collab.loc[df_collab['variable'].eq('collaboration_pct')]
 
     # Focus on augmentation patterns (validation, task iteration, learning)
-
-    results = {}
-    for region in ['North America', 'Latin America', 'Europe', 'Middle East & Africa', 'APAC']:
-        region_data = collab_pct[collab_pct['region'] == region]
-
-        validation_pct = region_data[region_data['cluster_name'] == 'validation']['value'].iloc[0]
-        task_iteration_pct = region_data[region_data['cluster_name'] == 'task iteration']['value'].iloc[0]
-        learning_pct = region_data[region_data['cluster_name'] == 'learning']['value'].iloc[0]
-
-        results[region] = {
-            'validation_pct': validation_pct,
-            'task_iteration_pct': task_iteration_pct,
-            'learning_pct': learning_pct
-        }
-
-        print(f"  {region}: Validation {validation_pct:.1f}%, Task Iteration {task_iteration_pct:.1f}%, Learning {learning_pct:.1f}%")
+    augmentation_patterns = {
+        'validation': 'validation_pct',
+        'task iteration': 'task_iteration_pct',
+        'learning': 'learning_pct'
+    }
+    collab_pct = collab_pct[collab_pct['cluster_name'].isin(augmentation_patterns)]
+
+    # Pivot to one row per region, one column per pattern
+    wide = (collab_pct.pivot(index='region', columns='cluster_name', values='value')
+            .rename(columns=augmentation_patterns)
+            .reindex(columns=list(augmentation_patterns.values())))
+
+    results = wide.reindex(pd.Index(REGIONS, name='region'))
+
+    # A missing pattern is missing data, not 0%, so refuse to score without it
+    missing = results.isna()
+    if missing.any(axis=None):
+        pattern_names = {col: pattern for pattern, col in augmentation_patterns.items()}
+        flags = missing.stack()
+        pairs = [f"{region}/{pattern_names[col]}"
+                 for region, col in flags[flags].index]
+        raise ValueError(f"Missing collaboration_pct rows for: {', '.join(pairs)}")
+
+    print("\n".join(
+        f"  {row.Index}: Validation {row.validation_pct:.1f}%, " +
+        f"Task Iteration {row.task_iteration_pct:.1f}%, " +
+        f"Learning {row.learning_pct:.1f}%"
+        for row in results.itertuples()))
 
     return results
 
 def extract_efficiency_metrics():
-    """Extract software development efficiency indices by region."""
+    """Extract software development efficiency indices, one row per region."""
     print("\nExtracting software development efficiency metrics...")
 
     # Load length data with complexity volumes
-    length_file = "../Onet Analysis/onetregionalraw_with_complexity.csv"
-    df_length = pd.read_csv(length_file)
+    df_length = load_source(LENGTH_FILE, LENGTH_COLUMNS)
 
     # Filter for software development domain only
-    sw_data = df_length[df_length['domain'] == 'Software_Development'].copy()
+    sw_data = df_length.loc[df_length['domain'].eq('Software_Development')]
 
     # Define efficiency metrics
     efficiency_metrics = {
@@ -62,58 +121,61 @@ def extract_efficiency_metrics():
         'cost_complexity_volume': 'sw_cost_index'
     }
 
-    results = {}
-    for region in ['North America', 'Latin America', 'Europe', 'Middle East & Africa', 'APAC']:
-        region_data = sw_data[sw_data['region'] == region]
-
-        # Get original volume total for software development
-        original_total = region_data[region_data['variable'] == 'onet_task_count']['value'].sum()
+    # Sum every variable per region in a single pass; a region with no rows for
+    # a variable sums to 0, as a masked sum would
+    totals = (sw_data.groupby(['region', 'variable'], observed=True)['value'].sum()
+              .unstack('variable', fill_value=0)
+              .reindex(columns=['onet_task_count', *efficiency_metrics], fill_value=0))
 
-        efficiency_indices = {}
-        for metric_var, metric_name in efficiency_metrics.items():
-            # Get efficiency volume total
-            efficiency_total = region_data[region_data['variable'] == metric_var]['value'].sum()
+    # Get original volume total for software development
+    original_total = totals['onet_task_count']
 
-            # Calculate weighted efficiency index
-            efficiency_index = efficiency_total / original_total if original_total > 0 else 0
-            efficiency_indices[metric_name] = efficiency_index
+    # Calculate weighted efficiency indices
+    indices = (totals[list(efficiency_metrics)]
+               .div(original_total, axis=0)
+               .where(original_total > 0, 0)
+               .rename(columns=efficiency_metrics))
 
-        results[region] = efficiency_indices
+    results = indices.reindex(pd.Index(REGIONS, name='region'), fill_value=0)
 
-        print(f"  {region}: Prompt {efficiency_indices['sw_prompt_length']:.3f}, " +
-              f"Completion {efficiency_indices['sw_completion_length']:.3f}, " +
-              f"Cost {efficiency_indices['sw_cost_index']:.3f}")
+    print("\n".join(
+        f"  {row.Index}: Prompt {row.sw_prompt_length:.3f}, " +
+        f"Completion {row.sw_completion_length:.3f}, " +
+        f"Cost {row.sw_cost_index:.3f}"
+        for row in results.itertuples()))
 
     return results
 
 def extract_complexity_metrics():
-    """Extract Level 0 software complexity request percentages by region."""
+    """Extract Level 0 software complexity request percentages, one row per region."""
     print("\nExtracting software complexity metrics...")
 
     # Load software request data
-    request_file = "../Software Request Analysis/softwareregionalrequests_with_sdlc.csv"
-    df_requests = pd.read_csv(request_file)
+    df_requests = load_source(REQUEST_FILE, REQUEST_COLUMNS)
 
-    results = {}
-    for region in ['North America', 'Latin America', 'Europe', 'Middle East & Africa', 'APAC']:
-        region_data = df_requests[df_requests['region'] == region]
+    # Calculate total software requests per region
+    total_requests = df_requests.groupby('region', observed=True)['value'].sum()
 
-        # Calculate total software requests for this region
-        total_requests = region_data['value'].sum()
+    # Calculate Level 0 (highest complexity) requests per region
+    level0_requests = (df_requests[df_requests['level'] == 0]
+                       .groupby('region', observed=True)['value'].sum()
+                       .reindex(total_requests.index, fill_value=0))
 
-        # Calculate Level 0 (highest complexity) requests
-        level0_requests = region_data[region_data['level'] == 0]['value'].sum()
+    # Calculate percentage
+    level0_pct = (level0_requests / total_requests * 100).where(total_requests > 0, 0)
 
-        # Calculate percentage
-        level0_pct = (level0_requests / total_requests * 100) if total_requests > 0 else 0
+    out = pd.DataFrame({
+        'level0_sw_pct': level0_pct,
+        'total_sw_requests': total_requests.astype('int64'),
+        'level0_sw_requests': level0_requests.astype('int64')
+    })
 
-        results[region] = {
-            'level0_sw_pct': level0_pct,
-            'total_sw_requests': int(total_requests),
-            'level0_sw_requests': int(level0_requests)
-        }
+    results = out.reindex(pd.Index(REGIONS, name='region'), fill_value=0)
 
-        print(f"  {region}: Level 0: {level0_pct:.1f}% ({int(level0_requests):,} / {int(total_requests):,})")
+    print("\n".join(
+        f"  {row.Index}: Level 0: {row.level0_sw_pct:.1f}% " +
+        f"({row.level0_sw_requests:,} / {row.total_sw_requests:,})"
+        for row in results.itertuples()))
 
     return results
 
@@ -123,49 +185,33 @@ def create_regional_database():
     print("CREATING REGIONAL INPUT DATABASE")
     print("="*60)
 
-    # Extract all metrics
+    # Load sources in parallel, then extract all metrics
+    prefetch_sources()
     collab_metrics = extract_collaboration_metrics()
     efficiency_metrics = extract_efficiency_metrics()
     complexity_metrics = extract_complexity_metrics()
 
-    # Combine into single database
-    regions = ['North America', 'Latin America', 'Europe', 'Middle East & Africa', 'APAC']
-
-    database = []
-    for region in regions:
-        row = {
-            'region': region,
-            'validation_pct': collab_metrics[region]['validation_pct'],
-            'task_iteration_pct': collab_metrics[region]['task_iteration_pct'],
-            'learning_pct': collab_metrics[region]['learning_pct'],
-            'sw_prompt_length': efficiency_metrics[region]['sw_prompt_length'],
-            'sw_completion_length': efficiency_metrics[region]['sw_completion_length'],
-            'sw_cost_index': efficiency_metrics[region]['sw_cost_index'],
-            'level0_sw_pct': complexity_metrics[region]['level0_sw_pct'],
-            'total_sw_requests': complexity_metrics[region]['total_sw_requests'],
-            'level0_sw_requests': complexity_metrics[region]['level0_sw_requests']
-        }
-        database.append(row)
-
-    # Create DataFrame and save
-    df_database = pd.DataFrame(database)
+    # Combine into single database and save
+    df_database = (pd.concat([collab_metrics, efficiency_metrics, complexity_metrics], axis=1)
+                   .reindex(pd.Index(REGIONS, name='region'))
+                   .reset_index())
     output_file = "regional_inputs.csv"
     df_database.to_csv(output_file, index=False)
 
     print(f"\n✅ Regional input database created: {output_file}")
     print(f"   Database shape: {df_database.shape}")
-    print(f"   Regions: {len(regions)}")
+    print(f"   Regions: {len(REGIONS)}")
     print(f"   Metrics per region: {len(df_database.columns) - 1}")
 
     # Display summary
     print(f"\n📊 REGIONAL INPUT SUMMARY:")
     print("-" * 80)
-    for _, row in df_database.iterrows():
-        print(f"{row['region']:<20}: " +
-              f"Validation {row['validation_pct']:5.1f}% | " +
-              f"Task Iter {row['task_iteration_pct']:5.1f}% | " +
-              f"Learning {row['learning_pct']:5.1f}% | " +
-              f"Level0 {row['level0_sw_pct']:5.1f}%")
+    for row in df_database.itertuples(index=False):
+        print(f"{row.region:<20}: " +
+              f"Validation {row.validation_pct:5.1f}% | " +
+              f"Task Iter {row.task_iteration_pct:5.1f}% | " +
+              f"Learning {row.learning_pct:5.1f}% | " +
+              f"Level0 {row.level0_sw_pct:5.1f}%")
 
     return df_database
 
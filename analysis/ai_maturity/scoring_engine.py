@@ -26,7 +26,7 @@ def calculate_collaboration_score(validation_pct, task_iteration_pct, learning_p
         learning_pct: Percentage of learning collaboration
 
     Returns:
-        float: Collaboration score (0-100)
+        float or pd.Series: Collaboration score (0-100), matching the input type
     """
     # Sum augmentation patterns (validation + task iteration + learning)
     augmentation_total = validation_pct + task_iteration_pct + learning_pct
@@ -49,7 +49,7 @@ def calculate_efficiency_score(prompt_length, completion_length, cost_index):
         cost_index: Software development cost index
 
     Returns:
-        float: Efficiency score (0-100)
+        float or pd.Series: Efficiency score (0-100), matching the input type
     """
     # Combine the three length dimensions
     total_length = prompt_length + completion_length + cost_index
@@ -66,7 +66,7 @@ def calculate_complexity_score(level0_sw_pct):
         level0_sw_pct: Percentage of Level 0 (highest complexity) software requests
 
     Returns:
-        float: Complexity score (0-100)
+        float or pd.Series: Complexity score (0-100), matching the input type
     """
     return level0_sw_pct
 
@@ -111,31 +111,23 @@ def calculate_maturity_scores(data_df, weights=None):
     if weights is None:
         weights = {'collaboration': 0.40, 'efficiency': 0.20, 'complexity': 0.40}
 
-    # Calculate raw component scores
-    collaboration_raw = []
-    efficiency_raw = []
-    complexity_raw = []
-
-    for _, row in data_df.iterrows():
-        # Collaboration score (augmentation patterns)
-        collab_score = calculate_collaboration_score(
-            row['validation_pct'],
-            row['task_iteration_pct'],
-            row['learning_pct']
-        )
-        collaboration_raw.append(collab_score)
-
-        # Efficiency score (combined length indices - will be inverted)
-        eff_score = calculate_efficiency_score(
-            row['sw_prompt_length'],
-            row['sw_completion_length'],
-            row['sw_cost_index']
-        )
-        efficiency_raw.append(eff_score)
-
-        # Complexity score (Level 0 percentage)
-        complex_score = calculate_complexity_score(row['level0_sw_pct'])
-        complexity_raw.append(complex_score)
+    # Calculate raw component scores column-wise (the scorers are plain arithmetic)
+    # Collaboration score (augmentation patterns)
+    collaboration_raw = calculate_collaboration_score(
+        data_df['validation_pct'],
+        data_df['task_iteration_pct'],
+        data_df['learning_pct']
+    )
+
+    # Efficiency score (combined length indices - will be inverted)
+    efficiency_raw = calculate_efficiency_score(
+        data_df['sw_prompt_length'],
+        data_df['sw_completion_length'],
+        data_df['sw_cost_index']
+    )
+
+    # Complexity score (Level 0 percentage)
+    complexity_raw = calculate_complexity_score(data_df['level0_sw_pct'])
 
     # Normalize all scores to 0-100 scale
     collaboration_normalized = normalize_scores(collaboration_raw)
@@ -188,9 +180,12 @@ def print_scoring_summary(results_df):
     print("-" * 80)
 
     # Find leaders in each dimension
-    collab_leader = results_df.loc[results_df['collaboration_score'].idxmax(), 'region']
-    efficiency_leader = results_df.loc[results_df['efficiency_score'].idxmax(), 'region']
-    complexity_leader = results_df.loc[results_df['complexity_score'].idxmax(), 'region']
+    leaders = (results_df.set_index('region')
+               [['collaboration_score', 'efficiency_score', 'complexity_score']]
+               .idxmax())
+    collab_leader = leaders['collaboration_score']
+    efficiency_leader = leaders['efficiency_score']
+    complexity_leader = leaders['complexity_score']
 
     print(f"🤝 Collaboration Leader: {collab_leader}")
     print(f"⚡ Efficiency Leader: {efficiency_leader}")
@@ -29,15 +29,24 @@ def load_api_complexity_benchmarks(api_file_path):
     complexity_benchmarks = {}
 
     with open(api_file_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+        # Index fields by position; a dict per row is costly on the full API export
+        reader = csv.reader(f)
+        header = next(reader)
+        facet_idx = header.index('facet')
+        cluster_idx = header.index('cluster_name')
+        value_idx = header.index('value')
+
         for row in reader:
+            facet = row[facet_idx]
+            cluster_name = row[cluster_idx]
+
             # Look for onet_task::* facets with ::index cluster names
-            if ('onet_task::' in row['facet'] and
-                '::index' in row['cluster_name']):
+            if ('onet_task::' in facet and
+                '::index' in cluster_name):
 
-                task_name = row['cluster_name'].replace('::index', '')
-                metric_type = row['facet'].split('::')[1]  # prompt_tokens, completion_tokens, cost
-                complexity_index = float(row['value'])
+                task_name = cluster_name.replace('::index', '')
+                metric_type = facet.split('::')[1]  # prompt_tokens, completion_tokens, cost
+                complexity_index = float(row[value_idx])
 
                 if task_name not in complexity_benchmarks:
                     complexity_benchmarks[task_name] = {}
@@ -7,6 +7,7 @@ positive software indicators AND negative exclusions.
 """
 
 import csv
+import re
 import pandas as pd
 
 def strict_software_filter():
@@ -56,67 +57,56 @@ def strict_software_filter():
         'single-digit number', 'random number', 'count to'
     ]
 
+    # Compile each keyword list into one case-folded alternation so a cluster
+    # name is scanned once per list rather than once per keyword
+    software_pattern = re.compile('|'.join(re.escape(keyword.lower()) for keyword in software_required))
+    exclusion_pattern = re.compile('|'.join(re.escape(exclusion.lower()) for exclusion in exclusions))
+
     # Load data
     df = pd.read_csv(input_file)
+    df['value'] = df['value'].astype(float)
     print(f"Original records: {len(df)}")
 
-    # Apply strict filtering
-    def is_software_request(cluster_name):
-        cluster_lower = cluster_name.lower()
-
-        # Must have at least one strong software indicator
-        has_software_keyword = any(keyword.lower() in cluster_lower for keyword in software_required)
+    # Apply strict filtering once per distinct cluster name (each repeats across
+    # regions and levels): must have at least one strong software indicator
+    # and no exclusion keywords
+    cluster_names = df['cluster_name'].drop_duplicates()
+    cluster_lower = cluster_names.str.lower()
 
-        # Must not have any exclusion keywords
-        has_exclusion = any(exclusion.lower() in cluster_lower for exclusion in exclusions)
-
-        return has_software_keyword and not has_exclusion
+    # The software check rejects most names, so only its survivors are
+    # scanned for exclusions
+    has_software_keyword = cluster_lower.str.contains(software_pattern)
+    candidates = cluster_lower[has_software_keyword]
+    software_clusters = cluster_names[has_software_keyword][~candidates.str.contains(exclusion_pattern)]
+    is_software = df['cluster_name'].isin(software_clusters)
 
     # Filter the data
-    filtered_df = df[df['cluster_name'].apply(is_software_request)].copy()
+    filtered_df = df[is_software].copy()
 
     print(f"After strict filtering: {len(filtered_df)} records")
     print(f"Removed: {len(df) - len(filtered_df)} records")
 
     # Show some examples of what was removed
-    removed_df = df[~df['cluster_name'].apply(is_software_request)]
+    removed_df = df[~is_software]
     print(f"\nSample of removed clusters:")
     unique_removed = removed_df['cluster_name'].unique()[:10]
     for cluster in unique_removed:
         print(f"  - {cluster}")
 
     # Recalculate percentages for the filtered data
-    results = []
-
-    for region in filtered_df['region'].unique():
-        for level in filtered_df['level'].unique():
-            # Get request_count records for this region-level combination
-            mask = ((filtered_df['region'] == region) &
-                   (filtered_df['level'] == level) &
-                   (filtered_df['variable'] == 'request_count'))
-
-            group_data = filtered_df[mask].copy()
-
-            if len(group_data) == 0:
-                continue
-
-            # Calculate total for this region-level
-            total_count = group_data['value'].astype(float).sum()
+    count_data = filtered_df[filtered_df['variable'] == 'request_count']
 
-            # Add request_count records
-            for _, row in group_data.iterrows():
-                results.append(row.to_dict())
+    # Calculate total for each region-level combination in a single groupby
+    total_count = count_data['value'].groupby([count_data['region'], count_data['level']]).transform('sum')
 
-            # Calculate and add request_pct records
-            for _, row in group_data.iterrows():
-                pct_row = row.copy()
-                pct_row['variable'] = 'request_pct'
-                pct_row['value'] = (float(row['value']) / total_count) * 100
-                pct_row['calculation_method'] = 'count_based_composition'
-                results.append(pct_row.to_dict())
+    # Calculate request_pct records for all groups at once
+    pct_data = count_data.copy()
+    pct_data['variable'] = 'request_pct'
+    pct_data['value'] = count_data['value'] / total_count * 100
+    pct_data['calculation_method'] = 'count_based_composition'
 
-    # Create new dataframe
-    strict_df = pd.DataFrame(results)
+    # Create new dataframe with request_count and request_pct records
+    strict_df = pd.concat([count_data, pct_data], ignore_index=True)
 
     # Sort by region, level, variable, value (descending for counts)
     strict_df = strict_df.sort_values(['region', 'level', 'variable', 'value'],
@@ -130,14 +120,10 @@ def strict_software_filter():
 
     # Validation
     print("\nValidation - Percentage sums by region and level:")
-    for region in strict_df['region'].unique():
-        for level in strict_df['level'].unique():
-            pct_data = strict_df[(strict_df['region'] == region) &
-                                (strict_df['level'] == level) &
-                                (strict_df['variable'] == 'request_pct')]
-            if len(pct_data) > 0:
-                pct_sum = pct_data['value'].astype(float).sum()
-                print(f"  {region}, Level {level}: {pct_sum:.6f}%")
+    pct_data = strict_df[strict_df['variable'] == 'request_pct']
+    pct_sums = pct_data['value'].groupby([pct_data['region'], pct_data['level']]).sum()
+    for (region, level), pct_sum in pct_sums.items():
+        print(f"  {region}, Level {level}: {pct_sum:.6f}%")
 
 if __name__ == "__main__":
     strict_software_filter()
\ No newline at end of file